@@ -4,37 +4,108 @@ from __future__ import annotations
 import os
 import sys
 import argparse
+import atexit
 import ast
 import csv
+import functools
+import itertools
+import json
+import mmap
 import re
 from pathlib import Path
-import subprocess
+from concurrent.futures import ProcessPoolExecutor
 
 lookup = {}
 
+# Matches the header name of an `#include <...>` / `#include "..."` directive.
+# Bytes pattern: C/C++ sources are scanned undecoded, straight off an mmap.
+# Whitespace is allowed around the `#` (`#  include`, `#include<x>`) as in C.
+_INCLUDE_RE = re.compile(rb'^[ \t]*#[ \t]*include[ \t]*[<"]([^>"\r\n]+)[>"]', re.M)
+
+# #include directives live at the top of a translation unit; only this many
+# leading bytes of a C/C++ file are scanned, so big generated sources stay cheap.
+INCLUDE_SCAN_BYTES = 64 * 1024
+
+# Fast path for Python imports: statements that start a line.
+#   group 1 -> the name list of `import a.b as c, d`
+#   group 2 -> the module of `from a.b import x` (empty for `from . import x`)
+_IMPORT_RE = re.compile(
+    r'^[ \t]*(?:import[ \t]+([^\n#;]+)|from(?:[ \t]+|(?=\.))\.*([\w.]*)[ \t]+import\b)',
+    re.M,
+)
+# Import forms a line regex cannot read reliably: one-line compound statements
+# (`try: import x`, `a = 1; import b`), backslash continuations of an import,
+# and import-like lines continuing the previous line (e.g. inside a string).
+_IMPORT_AMBIGUOUS_RE = re.compile(
+    r'[:;][ \t]*(?:import|from)[ \t]|^[ \t]*(?:import|from)[ \t][^\n]*\\\r?$'
+    r'|\\\r?\n[ \t]*(?:import|from)[ \t]',
+    re.M,
+)
+# Comments and string literals, matched left to right so a quote inside one
+# (`'"""'`, `# it's`) is never taken for the start of another. A bare triple
+# quote (tried after the closed forms) is one that is never closed.
+_STRING_RE = re.compile(
+    r'#[^\n]*'
+    r'|"""[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*"""'
+    r"|'''[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'''"
+    r'|"""|\'\'\''
+    r'|"[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*"|\'[^\'\\\n]*(?:\\[\s\S][^\'\\\n]*)*\''
+)
+
 # ------------------------
 # CSV LOADING / ARG PARSE
 # ------------------------
 
 DEFAULT_CSV_NAME = "pythonLicenses.csv"
 
+# CSV columns the lookup is built from.
+_LICENSE_COLUMNS = ("package", "license")
+
 def load_license_lookup(csv_path: str = DEFAULT_CSV_NAME):
     """
-    Load the license CSV into a dict-of-dicts keyed by 'package'.
-    Honors the csv_path passed in.
+    Load the license CSV into a dict mapping lower-cased 'package' -> 'license'.
+    Honors the csv_path passed in. The parsed table is memoized per
+    (path, mtime), so repeated calls only re-read the CSV after it changes;
+    treat the returned dict as read-only.
     """
     csv_path = Path(csv_path).expanduser().resolve()
     if not csv_path.exists():
         raise FileNotFoundError(f"License CSV not found: {csv_path}")
 
-    dict_of_dicts = {}
-    with csv_path.open(mode='r', encoding='utf-8') as csv_file:
-        csv_reader = csv.DictReader(csv_file)
+    return _load_license_csv(str(csv_path), csv_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_license_csv(csv_path: str, mtime_ns: int):
+    # mtime_ns is only part of the cache key
+    lookup_table = {}
+    with open(csv_path, mode='r', encoding='utf-8', newline='') as csv_file:
+        csv_reader = csv.reader(csv_file)
+        header = next(csv_reader, [])
+        missing = [c for c in _LICENSE_COLUMNS if c not in header]
+        if missing:
+            raise ValueError(f"License CSV {csv_path} is missing column(s): {', '.join(missing)}")
+        pkg_i, lic_i = (header.index(c) for c in _LICENSE_COLUMNS)
+        width = max(pkg_i, lic_i)
+
+        intern = sys.intern  # a few dozen license names repeat across every row
         for row in csv_reader:
-            pkg = (row.get('package') or '').strip()
+            if len(row) <= width:
+                continue
+            pkg = row[pkg_i].strip()
             if pkg:
-                dict_of_dicts[pkg.lower()] = row  # normalize key to lower
-    return dict_of_dicts
+                lookup_table[pkg.lower()] = intern(row[lic_i])  # normalize key to lower
+    return lookup_table
+
+
+def _positive_int(value):
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return n
 
 
 def parse_args():
@@ -50,6 +121,18 @@ def parse_args():
         "--license-dir", metavar="DIR",
         help=f"Directory containing {DEFAULT_CSV_NAME}."
     )
+    p.add_argument(
+        "-j", "--jobs", metavar="N", type=_positive_int, default=None,
+        help="Worker processes for directory scans (default: usable CPUs; 1 disables)."
+    )
+    p.add_argument(
+        "--exact", action="store_true",
+        help="Parse every Python source with ast instead of the faster line scan."
+    )
+    p.add_argument(
+        "--no-cache", action="store_true",
+        help="Ignore and don't update the import cache (~/.cache/snoopy/imports.json)."
+    )
     p.add_argument(
         "targets", nargs="*", default=["."],
         help="Files/dirs to scan (default: current directory)"
@@ -79,32 +162,142 @@ def resolve_csv_from_args(args) -> Path:
 # PARSERS
 # ------------------------
 
-def parse_python_file(filepath):
-    with open(filepath, "r", encoding="utf-8") as f:
-        node = ast.parse(f.read(), filename=filepath)
-    return sorted(
-        {n.name.split('.')[0] for n in ast.walk(node) if isinstance(n, ast.Import) for n in n.names}
-        |
-        {n.module.split('.')[0] for n in ast.walk(node) if isinstance(n, ast.ImportFrom) and n.module}
-    )
+# Fields that hold nested statement lists (def/class/if/for/while/with/try/match
+# bodies, except handlers, match cases). Imports are statements, so nothing
+# below an expression ever needs visiting.
+_STMT_BLOCKS = ("body", "orelse", "finalbody", "handlers", "cases")
 
-def parse_ipynb_file(filepath):
-    try:
-        import nbformat
-    except ImportError:
-        print("nbformat not installed, skipping notebook parsing.")
+def _collect_imports(tree):
+    """
+    Returns the set of top-level module names imported anywhere in `tree`.
+    Walks an explicit stack of statements, descending only into nested
+    statement blocks, and handles Import and ImportFrom in the same pass.
+    Names are interned so the same module seen across many files is one string.
+    """
+    intern = sys.intern
+    imports = set()
+    add = imports.add
+    stack = [tree]
+    pop, extend = stack.pop, stack.extend
+    Import, ImportFrom = ast.Import, ast.ImportFrom
+    while stack:
+        node = pop()
+        t = type(node)
+        if t is Import:
+            for alias in node.names:
+                add(intern(alias.name.partition('.')[0]))
+        elif t is ImportFrom:
+            if node.module:
+                add(intern(node.module.partition('.')[0]))
+        else:
+            for field in _STMT_BLOCKS:
+                block = getattr(node, field, None)
+                if type(block) is list:
+                    extend(block)
+    return imports
+
+def _in_string(source, positions):
+    """
+    True if any offset in `positions` may sit inside a multi-line string
+    literal. Only triple-quoted strings can span lines without a backslash
+    (continuations are left to _IMPORT_AMBIGUOUS_RE), so sources without a
+    triple quote are skipped. An unclosed triple quote counts as True so the
+    caller falls back to ast.
+    """
+    if '"""' not in source and "'''" not in source:
+        return False
+    regions = []
+    for m in _STRING_RE.finditer(source):
+        lo, hi = m.span()
+        if hi - lo == 3 and m.group() in ('"""', "'''"):
+            return True
+        regions.append((lo, hi))
+    return any(lo < pos < hi for pos in positions for lo, hi in regions)
+
+def _scan_imports(source):
+    """
+    Lexical import scan: matches import statements line by line instead of
+    building an AST. Returns the set of top-level module names, or None if
+    the source holds import forms the regex can't read reliably; callers
+    then fall back to ast.parse.
+    """
+    if _IMPORT_AMBIGUOUS_RE.search(source):
+        return None
+    matches = list(_IMPORT_RE.finditer(source))
+    if matches and _in_string(source, [m.start() for m in matches]):
+        return None
+    intern = sys.intern
+    imports = set()
+    for names, module in (m.groups('') for m in matches):
+        if module:
+            candidates = (module,)
+        else:
+            # "a.b as c, d" -> ["a.b", "d"]
+            candidates = [item.split()[0] for item in names.split(',') if item.strip()]
+        for name in candidates:
+            top = name.partition('.')[0]
+            if top.isidentifier():
+                imports.add(intern(top))
+    return imports
+
+def parse_python_file(filepath, exact=False):
+    """
+    Returns the sorted top-level modules imported by a .py file. By default
+    imports are found with a line scan (_scan_imports); exact=True, or a
+    file the scan can't read reliably, goes through ast.parse instead.
+    """
+    with open(filepath, "rb") as f:
+        data = f.read()
+    # Both `import x` and `from x import y` contain b"import"; a file without
+    # it cannot import anything, so skip scanning it.
+    if b"import" in data:
+        # utf-8-sig drops a leading BOM, which would otherwise hide an import on line 1
+        source = data.decode("utf-8-sig")
+        found = None if exact else _scan_imports(source)
+        if found is None:
+            found = _collect_imports(ast.parse(source, filename=filepath))
+        imports = sorted(found)
+    else:
+        imports = []
+    return imports
+
+def parse_ipynb_file(filepath, exact=False):
+    """
+    Returns the sorted top-level modules imported by a notebook's code cells,
+    scanning each cell the same way parse_python_file scans a file.
+    """
+    # Plain JSON is all we need: nbformat's validation and version upgrade
+    # cost far more than pulling the source out of the code cells.
+    with open(filepath, "rb") as f:
+        data = f.read()
+    # Notebook JSON stores cell source verbatim, so a notebook that never
+    # spells "import" needs no decoding at all (outputs can be megabytes).
+    if b"import" not in data:
         return []
-    with open(filepath, "r", encoding="utf-8") as f:
-        nb = nbformat.read(f, as_version=4)
+    nb = json.loads(data)
+
+    # v4 keeps cells at the top level; v3 nests them in worksheets and
+    # stores code cell source under "input".
+    cells = nb.get("cells")
+    if cells is None:
+        cells = [c for ws in nb.get("worksheets", ()) for c in ws.get("cells", ())]
+
     imports = set()
-    for cell in nb.cells:
-        if cell.cell_type == "code":
+    for cell in cells:
+        if cell.get("cell_type") != "code":
+            continue
+        source = cell.get("source", cell.get("input", ""))
+        if isinstance(source, list):
+            source = "".join(source)
+        if "import" not in source:
+            continue
+        found = None if exact else _scan_imports(source)
+        if found is None:
             try:
-                node = ast.parse(cell.source)
-                imports |= {n.name.split('.')[0] for n in ast.walk(node) if isinstance(n, ast.Import) for n in n.names}
-                imports |= {n.module.split('.')[0] for n in ast.walk(node) if isinstance(n, ast.ImportFrom) and n.module}
+                found = _collect_imports(ast.parse(source))
             except Exception:
-                pass
+                continue
+        imports |= found
     return sorted(imports)
 
 def parse_c_cpp_file(filepath):
@@ -121,13 +314,11 @@ def parse_c_cpp_file(filepath):
     base_name = filename.replace(".cpp", "")
 
     try:
-        with open(filepath, "r") as f:
-            lines = f.readlines()
-
-        for line in lines:
-            match = re.match(r'^\s*#include\s+[<"](.*?)[">]', line)
-            if match:
-                includes.append(match.group(1))
+        with open(filepath, "rb") as f:
+            # mmap cannot map an empty file; there is nothing to scan anyway
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    includes = [h.decode("utf-8", "replace") for h in _INCLUDE_RE.findall(mm, 0, INCLUDE_SCAN_BYTES)]
 
         # Only generate Makefile for .cpp files (not headers)
         if str(filepath).endswith(".cpp"):
@@ -162,28 +353,42 @@ clean:
 # REPORTING
 # ------------------------
 
+# Standard-library module names (sys.stdlib_module_names needs 3.10+; older
+# interpreters only get the builtins and fall back to the CSV lookup).
+_STDLIB = frozenset(sys.builtin_module_names) | getattr(sys, "stdlib_module_names", frozenset())
+STDLIB_LICENSE = "Python Standard Library"
+
+_PY_SUFFIXES = frozenset({".py", ".ipynb"})
+_C_SUFFIXES = frozenset({".c", ".cpp", ".h", ".hpp"})
+
 def summarize_imports(import_dict, makefile_suggestions=None):
-    # summarize the imports I have used
-    print("=== 🐍 Package or file dependencies ===")
+    # summarize the imports I have used; the report is built in memory and
+    # written to stdout in one go rather than one print() per line
+    out = []
+    w = out.append
+    w("=== 🐍 Package or file dependencies ===\n")
+    py_deps = set()  # requirements.txt candidates, gathered while printing
     for file, imports in import_dict.items():
         suffix = Path(file).suffix
 
         # Handle Python and Jupyter files
-        if suffix in [".py", ".ipynb"]:
-            print(f"📄 {file}")
-            for imp in sorted(imports):
-                impStr = str(imp.split('.')[0]).lower()
-                try:
-                    license_info = lookup.get(impStr, {}).get('license')
-                    if license_info:
-                        print(f"  {imp} — {license_info}")
-                    else:
-                        print(f"  {imp}")
-                except Exception:
-                    print(f"  {imp}")
-
-        elif suffix in [".c", ".cpp"]:
-            print(f"📄 {file}")
+        if suffix in _PY_SUFFIXES:
+            w(f"📄 {file}\n")
+            py_deps.update(imports)
+            # parse_python_file / parse_ipynb_file already return sorted lists
+            for imp in imports:
+                if imp in _STDLIB:
+                    w(f"  {imp} — {STDLIB_LICENSE}\n")
+                    continue
+                # imports are already top-level names; lookup keys are lower-cased at load
+                license_info = lookup.get(imp.lower())
+                if license_info:
+                    w(f"  {imp} — {license_info}\n")
+                else:
+                    w(f"  {imp}\n")
+
+        elif suffix in _C_SUFFIXES:
+            w(f"📄 {file}\n")
 
             # imports may be a list (includes) OR a tuple (includes, mkfile) if caller didn't flatten
             flat_imports = []
@@ -197,71 +402,265 @@ def summarize_imports(import_dict, makefile_suggestions=None):
                     flat_imports.append(imp)
 
             for header in sorted(flat_imports):
-                print(f"  #include <{header}>")
+                w(f"  #include <{header}>\n")
 
             if makefile_suggestions and file in makefile_suggestions and makefile_suggestions[file]:
-                print("\n🛠 Suggested Makefile:\n")
-                print(makefile_suggestions[file])
+                w("\n🛠 Suggested Makefile:\n\n")
+                w(f"{makefile_suggestions[file]}\n")
 
         else:
-            print(f"📄 {file}")
-            print("  ❓ Unknown file type — skipped")
+            w(f"📄 {file}\n")
+            w("  ❓ Unknown file type — skipped\n")
+
+    # make suggestions for requirements.txt (only for Python files, never stdlib)
+    py_deps -= _STDLIB
+    if py_deps:
+        w("\n📦 Suggested requirements.txt:\n")
+        w("\n".join(sorted(py_deps)))
+        w("\n")
 
-    # make suggestions for requirements.txt (only for Python files)
-    all_deps = sorted({
-        imp for file, deps in import_dict.items()
-        if Path(file).suffix in [".py", ".ipynb"]
-        for imp in deps
-    })
-    if all_deps:
-        print("\n📦 Suggested requirements.txt:")
-        for dep in all_deps:
-            print(dep)
+    sys.stdout.write("".join(out))
 
 
 # ------------------------
 # DRIVER
 # ------------------------
 
-def snoopy_entry_point(path):
+# Parser per (lower-cased) file suffix. Python parsers return a sorted import
+# list; the C/C++ parser returns (includes, makefile_suggestion).
+FILE_PARSERS = {
+    ".py": parse_python_file,
+    ".ipynb": parse_ipynb_file,
+    ".c": parse_c_cpp_file,
+    ".cpp": parse_c_cpp_file,
+    ".h": parse_c_cpp_file,
+    ".hpp": parse_c_cpp_file,
+}
+
+# Directories that never hold project sources worth reporting (VCS metadata,
+# caches, virtualenvs, vendored JS, build output); the walk does not enter them.
+SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", "__pycache__", ".ipynb_checkpoints",
+    ".venv", "venv", ".tox", ".nox", "node_modules",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", "build", "dist",
+})
+
+def _iter_sources(root):
+    """
+    Walks `root` once with os.scandir and yields the path (str) of every file whose
+    (lower-cased) suffix has an entry in FILE_PARSERS. Symlinked dirs and
+    anything named in SKIP_DIRS are not descended into.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    stack.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in FILE_PARSERS and entry.is_file():
+                yield entry.path
+
+# Below this many files a process pool costs more to start than it saves.
+PARALLEL_MIN_FILES = 32
+
+# ProcessPoolExecutor rejects more workers than this on Windows.
+_WINDOWS_MAX_WORKERS = 61
+
+def _usable_cpus():
+    """
+    CPUs this process may run on: respects affinity masks and cgroup limits
+    where the platform exposes them, unlike a bare os.cpu_count().
+    """
+    if hasattr(os, "process_cpu_count"):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+def _pool_size(jobs=None):
+    """
+    Worker processes for the parse pool: `jobs` if given, else one per usable
+    CPU; capped on Windows as the executor requires.
+    """
+    size = jobs or _usable_cpus()
+    if sys.platform == "win32":
+        size = min(size, _WINDOWS_MAX_WORKERS)
+    return size
+
+def _parse_one(file, exact=False):
+    """
+    Parses a single source file given as a str path. Returns
+    (path, imports, makefile_suggestion); the suggestion is None for anything
+    but .cpp files. `exact` is passed on to the Python parsers.
+    """
+    parse = FILE_PARSERS[os.path.splitext(file)[1].lower()]
+    if parse is parse_c_cpp_file:
+        includes, mk = parse(file)
+        return file, includes, mk
+    return file, parse(file, exact=exact), None
+
+# ------------------------
+# IMPORT CACHE
+# ------------------------
+
+# Python/notebook import lists persisted between runs. On disk:
+#   {"version": _IMPORT_CACHE_VERSION,
+#    "entries": {abs_path: [st_mtime_ns, st_size, exact, imports]}}
+# Loaded on first use and written back once at exit, only if it changed.
+# Bump the version whenever the entry layout or what the scanners return
+# changes; a file with any other version is discarded.
+_IMPORT_CACHE_VERSION = 2
+# Oldest-written entries are dropped beyond this (files in trees that are
+# never rescanned, so never pruned).
+_IMPORT_CACHE_MAX_ENTRIES = 20000
+_IMPORT_CACHE = None
+_IMPORT_CACHE_DIRTY = False
+
+def _import_cache_path():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "snoopy", "imports.json")
+
+def _import_cache():
+    global _IMPORT_CACHE
+    if _IMPORT_CACHE is None:
+        try:
+            with open(_import_cache_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        entries = None
+        if isinstance(data, dict) and data.get("version") == _IMPORT_CACHE_VERSION:
+            entries = data.get("entries")
+        _IMPORT_CACHE = entries if isinstance(entries, dict) else {}
+        atexit.register(_save_import_cache)
+    return _IMPORT_CACHE
+
+def _save_import_cache():
+    if not _IMPORT_CACHE_DIRTY:
+        return
+    overflow = len(_IMPORT_CACHE) - _IMPORT_CACHE_MAX_ENTRIES
+    if overflow > 0:
+        # entries are re-inserted on every write, so the front holds the oldest
+        for stale in list(itertools.islice(_IMPORT_CACHE, overflow)):
+            del _IMPORT_CACHE[stale]
+    cache_path = _import_cache_path()
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": _IMPORT_CACHE_VERSION, "entries": _IMPORT_CACHE}, f)
+        os.replace(tmp_path, cache_path)  # readers never see a half-written file
+    except OSError as e:
+        print(f"[snoopy] could not write import cache {cache_path}: {e}", file=sys.stderr)
+
+def _parse_with_cache(files, parse_all, exact, root=None):
+    """
+    Yields (path, imports, makefile_suggestion) for each file in order,
+    serving unchanged .py/.ipynb files from the import cache and feeding only
+    the rest to `parse_all`, a callable that maps a list of paths to results.
+    `root` is the directory that produced `files`, if any: cached entries under
+    it that the walk no longer found belong to deleted files and are pruned.
+    """
+    global _IMPORT_CACHE_DIRTY
+    cache = _import_cache()
+    stamps = {}
+    todo = []
+    hits = {}
+    seen = set()
+    for file in files:
+        if FILE_PARSERS[os.path.splitext(file)[1].lower()] is parse_c_cpp_file:
+            todo.append(file)
+            continue
+        key = os.path.abspath(file)
+        seen.add(key)
+        try:
+            st = os.stat(file)
+        except OSError:
+            todo.append(file)  # let the parser report it
+            continue
+        stamp = [st.st_mtime_ns, st.st_size, exact]
+        entry = cache.get(key)
+        # anything but [mtime, size, exact, [imports]] is a miss, never an error
+        if (type(entry) is list and len(entry) == 4 and entry[:3] == stamp
+                and type(entry[3]) is list and all(type(x) is str for x in entry[3])):
+            hits[file] = (file, entry[3], None)
+        else:
+            stamps[file] = (key, stamp)
+            todo.append(file)
+
+    if root is not None:
+        prefix = os.path.join(os.path.abspath(root), "")
+        gone = [k for k in cache if k.startswith(prefix) and k not in seen]
+        for k in gone:
+            del cache[k]
+        if gone:
+            _IMPORT_CACHE_DIRTY = True
+
+    parsed = {}
+    for file, imports, mk in parse_all(todo):
+        parsed[file] = (file, imports, mk)
+        if file in stamps:
+            key, stamp = stamps[file]
+            cache.pop(key, None)  # re-insert at the end: newest entries last
+            cache[key] = stamp + [imports]
+            _IMPORT_CACHE_DIRTY = True
+
+    for file in files:
+        yield hits[file] if file in hits else parsed[file]
+
+def snoopy_entry_point(path, jobs=None, exact=False, use_cache=True):
     """
     Scans a file or directory. Relies on the global `lookup` already loaded in `main()`.
+    Directory scans parse files across `jobs` worker processes (default: one per CPU);
+    jobs=1 keeps everything in-process. exact=True parses Python sources with ast.
+    With use_cache, unchanged .py/.ipynb files are served from the on-disk import cache.
     """
+    if jobs is not None and jobs < 1:
+        raise ValueError(f"jobs must be >= 1, got {jobs}")
+
     print("snoopy_entry_point is running ...")
     all_imports = {}
     makefile_suggestions = {}
 
     path = Path(path)
+    root = None
     if path.is_file():
         ext = path.suffix.lower()
-        if ext == ".py":
-            imports = parse_python_file(path)
-            all_imports[str(path)] = imports
-        elif ext == ".ipynb":
-            imports = parse_ipynb_file(path)
-            all_imports[str(path)] = imports
-        elif ext in [".c", ".cpp", ".h"]:
-            includes, mk = parse_c_cpp_file(path)
-            all_imports[str(path)] = includes
-            if mk:
-                makefile_suggestions[str(path)] = mk
-        else:
+        files = [str(path)] if ext in FILE_PARSERS else []
+        if not files:
             print(f"⚠️ Unsupported file type: {ext}")
     else:
-        # directory walk
-        for file in path.rglob("*"):
-            ext = file.suffix.lower()
-            if ext == ".py":
-                imports = parse_python_file(file)
-                all_imports[str(file)] = imports
-            elif ext == ".ipynb":
-                imports = parse_ipynb_file(file)
-                all_imports[str(file)] = imports
-            elif ext in [".c", ".cpp", ".h"]:
-                includes, mk = parse_c_cpp_file(file)
-                all_imports[str(file)] = includes
-                if mk:
-                    makefile_suggestions[str(file)] = mk
+        root = str(path)
+        files = list(_iter_sources(root))
+
+    # files are independent, so big scans are parsed in parallel
+    parse_one = functools.partial(_parse_one, exact=exact)
+    workers = _pool_size(jobs)
+
+    def parse_all(todo):
+        # never start more processes than there are files to hand out
+        pool_workers = min(workers, len(todo))
+        if pool_workers > 1 and len(todo) >= PARALLEL_MIN_FILES:
+            # ~4 chunks per worker: few enough to amortize pickling, enough to balance load
+            chunksize = max(1, len(todo) // (4 * pool_workers))
+            with ProcessPoolExecutor(max_workers=pool_workers) as ex:
+                return list(ex.map(parse_one, todo, chunksize=chunksize))
+        return map(parse_one, todo)
+
+    if use_cache:
+        results = _parse_with_cache(files, parse_all, exact, root=root)
+    else:
+        results = parse_all(files)
+
+    for key, imports, mk in results:
+        all_imports[key] = imports
+        if mk:
+            makefile_suggestions[key] = mk
 
     summarize_imports(all_imports, makefile_suggestions=makefile_suggestions)
 
@@ -284,7 +683,7 @@ def main():
 
     # Scan each target
     for t in (args.targets or ["."]):
-        snoopy_entry_point(str(Path(t).resolve()))
+        snoopy_entry_point(str(Path(t).resolve()), jobs=args.jobs, exact=args.exact, use_cache=not args.no_cache)
 
 
 if __name__ == "__main__":